@@ -30,7 +30,7 @@ Align2Custom module implementation
 
 import math
 import mathutils as mu
-import threading as thd
+import numpy as np
 import time
 import bpy
 import blf
@@ -38,12 +38,21 @@ import bmesh
 
 
 # ## Global data ##############################################################
-GL_TOKEN_LOCK = thd.Event()  # Set while a smooth rotation is in progress
-_A2C_STOP_EVENT = thd.Event()  # Set during unregister to abort any running rotation thread
+# Addon package name, memoized so hot paths avoid re-reading the module global
+_PKG = __package__
+# Space pointers with a smooth rotation currently in progress
+_rotating_space_ptrs = set()
+# Live smooth-rotation timer callbacks (unregistered on addon unload)
+_active_rotation_timers = []
 # Storage for original perspective mode and rotation state for each area
 # Also stores pre-alignment view (rotation, location, distance) for "Leave aligned view"
-GL_VIEWPORT_STATE = {}      # Format: {area_ptr: {'original_perspective': str, 'aligned_rotation': quat, 'is_aligned': bool, 'view_rotation_before': quat, 'view_location_before': Vector, 'view_distance_before': float}}
-GL_DRAW_HANDLER = None      # Draw handler for monitoring viewport changes
+# Presence of an entry means that viewport is in aligned view; entries are
+# deleted as soon as the viewport leaves the aligned state
+GL_VIEWPORT_STATE = {}      # Format: {area_ptr: _ViewportState}
+# Owner token for the msgbus subscriptions that monitor viewport changes
+_MSGBUS_OWNER = object()
+# RegionView3D pointers already subscribed to (avoids duplicate subscriptions)
+_subscribed_rv3d_ptrs = set()
 _A2C_OVERLAY_HANDLER = None # Draw handler for the persistent aligned-view overlay text
 # Captured once when the first viewport enters aligned view; restored when the last one leaves.
 # Prevents the "last leaver restores wrong value" bug when multiple viewports are aligned.
@@ -55,6 +64,22 @@ _A2C_USE_AUTO_PERSPECTIVE_BEFORE_ANY = None
 # Rotation dot product threshold: below this value (~2.5°) the view is
 # considered rotated away from the aligned position.
 A2C_ROTATION_DOT_THRESHOLD = 0.999
+# Squared threshold for the monitoring hot path: comparing d*d against it is
+# equivalent to comparing abs(d) but skips the Python-level abs() call.
+_ROTATION_DOT_THRESHOLD_SQ = A2C_ROTATION_DOT_THRESHOLD * A2C_ROTATION_DOT_THRESHOLD
+
+# Minimum interval (seconds) between real viewport-monitoring checks.
+# Python-driven view writes publish through RNA and can notify in bursts
+# (scripts, other addons, our own smooth-rotation ticks); throttling keeps
+# the monitoring cost to a single clock compare per notification.
+_MONITOR_MIN_INTERVAL = 0.05
+_monitor_last_check = 0.0
+
+# Interval (seconds) of the safety-net poll that runs while viewports are
+# aligned. Blender's interactive navigation mutates RegionView3D in C without
+# always publishing through RNA, so msgbus notifications alone can miss orbit
+# gestures entirely; the poll guarantees the restore check still runs.
+_MONITOR_POLL_INTERVAL = 0.25
 
 # Viewpoint enum items shared by all operators that accept a viewpoint argument.
 A2C_VIEWPOINT_ITEMS = (
@@ -75,6 +100,10 @@ A2C_PIE_MODE_ITEMS = (
     ('EDGE',      'Edge',      'Align to selected edge (Edit Mode, only one edge must be selected)', 'MOD_EDGESPLIT',   3),
 )
 
+# Right angles in radians, precomputed once for the per-click rotation paths.
+_RAD_90 = math.radians(90.0)
+_RAD_180 = math.radians(180.0)
+
 # Roll angles (degrees) tested when minimizing viewport roll.
 A2C_ROLL_ANGLES = (0, 90, 180, 270)
 # Precomputed Z-rotation matrices for roll angles (avoids repeated allocation in hot paths).
@@ -83,19 +112,30 @@ A2C_ROLL_MATRICES = tuple(mu.Matrix.Rotation(math.radians(a), 3, 'Z') for a in A
 # Viewpoint rotation matrices built once at load time.
 A2C_VIEWPOINT_MATRICES = {
     "TOP":    mu.Matrix.Identity(3),
-    "BOTTOM": mu.Matrix.Rotation(math.radians(180.0), 3, 'X'),
-    "FRONT":  mu.Matrix.Rotation(math.radians(90.0), 3, 'X'),
-    "BACK":   mu.Matrix.Rotation(math.radians(90.0), 3, 'X') @ mu.Matrix.Rotation(math.radians(180.0), 3, 'Y'),
-    "RIGHT":  mu.Matrix.Rotation(math.radians(90.0), 3, 'X') @ mu.Matrix.Rotation(math.radians(90.0), 3, 'Y'),
-    "LEFT":   mu.Matrix.Rotation(math.radians(90.0), 3, 'X') @ mu.Matrix.Rotation(math.radians(-90.0), 3, 'Y'),
+    "BOTTOM": mu.Matrix.Rotation(_RAD_180, 3, 'X'),
+    "FRONT":  mu.Matrix.Rotation(_RAD_90, 3, 'X'),
+    "BACK":   mu.Matrix.Rotation(_RAD_90, 3, 'X') @ mu.Matrix.Rotation(_RAD_180, 3, 'Y'),
+    "RIGHT":  mu.Matrix.Rotation(_RAD_90, 3, 'X') @ mu.Matrix.Rotation(_RAD_90, 3, 'Y'),
+    "LEFT":   mu.Matrix.Rotation(_RAD_90, 3, 'X') @ mu.Matrix.Rotation(-_RAD_90, 3, 'Y'),
 }
 
+# Viewpoint names in dict order and their view directions (-Z column) stacked
+# as a (6, 3) array, so the NEAREST search is a single numpy matmul instead of
+# six Python-level matrix multiplications.
+_VIEWPOINT_NAMES = tuple(A2C_VIEWPOINT_MATRICES)
+_VIEWPOINT_NEG_Z = np.array([tuple(-m.col[2])
+                             for m in A2C_VIEWPOINT_MATRICES.values()])
+
+# View direction in view-local space; rotating it by the view quaternion gives
+# the world-space view direction without a quaternion-to-matrix round-trip.
+_NEG_Z = mu.Vector((0.0, 0.0, -1.0))
+
 
 # ## Viewport monitoring system ###############################################
 def get_prefs(context):
     """Return addon preferences or None if not available."""
     try:
-        return context.preferences.addons[__package__].preferences
+        return context.preferences.addons[_PKG].preferences
     except Exception:
         return None
 
@@ -114,7 +154,7 @@ def _capture_auto_perspective_if_first(context):
     viewport leaves. Safe to call even when Force Ortho is off.
     """
     global _A2C_USE_AUTO_PERSPECTIVE_BEFORE_ANY
-    if any(st.get('is_aligned') for st in GL_VIEWPORT_STATE.values()):
+    if GL_VIEWPORT_STATE:
         return
     try:
         _A2C_USE_AUTO_PERSPECTIVE_BEFORE_ANY = context.preferences.inputs.use_auto_perspective
@@ -128,7 +168,7 @@ def _restore_auto_perspective_if_last(context):
     preference that was captured before any viewport entered aligned view.
     """
     global _A2C_USE_AUTO_PERSPECTIVE_BEFORE_ANY
-    if any(st.get('is_aligned') for st in GL_VIEWPORT_STATE.values()):
+    if GL_VIEWPORT_STATE:
         return
     if _A2C_USE_AUTO_PERSPECTIVE_BEFORE_ANY is not None:
         try:
@@ -136,6 +176,56 @@ def _restore_auto_perspective_if_last(context):
         except Exception:
             pass
         _A2C_USE_AUTO_PERSPECTIVE_BEFORE_ANY = None
+    # Nothing left to watch, but this can run from inside a msgbus
+    # notification, and clearing an owner from within its own notify callback
+    # is not guaranteed safe. Defer the teardown to a one-shot timer that
+    # re-checks nothing was re-aligned in the interim.
+    try:
+        if not bpy.app.timers.is_registered(_deferred_monitor_teardown):
+            bpy.app.timers.register(_deferred_monitor_teardown)
+    except Exception:
+        pass
+
+
+class _ViewportState:
+    """
+    Per-viewport alignment state, keyed by area pointer in GL_VIEWPORT_STATE.
+    A __slots__ class keeps entries compact and makes the attribute reads in
+    the monitoring hot path cheaper than string-keyed dict lookups.
+    Fields that were not captured stay None. An entry existing in
+    GL_VIEWPORT_STATE is what marks its viewport as aligned; there is no
+    separate flag.
+    """
+    __slots__ = (
+        'original_perspective', 'aligned_rotation', 'aligned_rotation_base',
+        'view_rotation_before', 'view_location_before',
+        'view_distance_before', 'transform_orientation_before',
+        'object_align_before', 'use_auto_perspective_before', 'base_matrix',
+        'last_seen',
+    )
+
+    def __init__(self, original_perspective, aligned_rotation):
+        self.original_perspective = original_perspective
+        self.aligned_rotation = aligned_rotation
+        # Never updated by roll/pivot; used for "from original"
+        self.aligned_rotation_base = aligned_rotation.copy()
+        self.view_rotation_before = None
+        self.view_location_before = None
+        self.view_distance_before = None
+        self.transform_orientation_before = None
+        self.object_align_before = None
+        self.use_auto_perspective_before = None
+        self.base_matrix = None
+        # (w, x, y, z, view_perspective) last examined by the monitor;
+        # lets the hot loop skip unchanged viewports with a tuple compare
+        self.last_seen = None
+
+    def copy(self):
+        """Shallow copy, used when migrating state to a recreated area."""
+        other = _ViewportState(self.original_perspective, self.aligned_rotation)
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
 
 
 def store_viewport_state(area, original_perspective, aligned_rotation,
@@ -145,55 +235,69 @@ def store_viewport_state(area, original_perspective, aligned_rotation,
     """Store the original viewport state before alignment (for restore on leave)"""
     area_ptr = get_area_pointer(area)
     if area_ptr:
-        global GL_VIEWPORT_STATE
-        state = {
-            'original_perspective': original_perspective,
-            'aligned_rotation': aligned_rotation,
-            'aligned_rotation_base': aligned_rotation.copy(),  # Never updated by roll/pivot; used for "from original"
-            'is_aligned': True
-        }
+        state = _ViewportState(original_perspective, aligned_rotation)
         if view_rotation_before is not None:
-            state['view_rotation_before'] = view_rotation_before.copy()
+            state.view_rotation_before = view_rotation_before.copy()
         if view_location_before is not None:
-            state['view_location_before'] = view_location_before.copy()
+            state.view_location_before = view_location_before.copy()
         if view_distance_before is not None:
-            state['view_distance_before'] = float(view_distance_before)
+            state.view_distance_before = float(view_distance_before)
         if transform_orientation_before is not None:
-            state['transform_orientation_before'] = str(transform_orientation_before)
+            state.transform_orientation_before = str(transform_orientation_before)
         if object_align_before is not None:
-            state['object_align_before'] = str(object_align_before)
+            state.object_align_before = str(object_align_before)
         if use_auto_perspective_before is not None:
-            state['use_auto_perspective_before'] = bool(use_auto_perspective_before)
+            state.use_auto_perspective_before = bool(use_auto_perspective_before)
         if base_matrix is not None:
-            state['base_matrix'] = base_matrix.copy()
+            state.base_matrix = base_matrix.copy()
         GL_VIEWPORT_STATE[area_ptr] = state
+        # Start monitoring lazily, on the first aligned viewport
+        _install_monitor()
 
 
 def _restore_aligned_state_settings(window, state):
     """
-    Restore transform orientation and object align from the stored state dict.
+    Restore transform orientation and object align from the stored
+    _ViewportState.
     Auto-perspective is intentionally NOT restored here; use
     _restore_auto_perspective_if_last() after marking the viewport as unaligned
     so the preference is only restored when the last aligned viewport leaves.
     Swallows errors.
     """
-    if 'transform_orientation_before' in state:
+    if state.transform_orientation_before is not None:
         try:
-            window.scene.transform_orientation_slots[0].type = state['transform_orientation_before']
+            window.scene.transform_orientation_slots[0].type = state.transform_orientation_before
         except Exception:
             pass
-    if 'object_align_before' in state:
+    if state.object_align_before is not None:
         try:
-            bpy.context.preferences.edit.object_align = state['object_align_before']
+            bpy.context.preferences.edit.object_align = state.object_align_before
             if 'a2c_object_align_before' in window.scene:
                 del window.scene['a2c_object_align_before']
         except Exception:
             pass
 
 
+# Reverse index {area_ptr: (window, area)} so the monitor resolves tracked
+# areas without nested lookups inside the loop. Rebuilt from the live layout
+# at the start of every check: area/window RNA wrappers must never be held
+# across checks, because closing an area leaves a dangling wrapper behind and
+# a newly created area can even reuse the freed pointer.
+_AREA_LOOKUP = {}
+
+
+def _rebuild_area_lookup():
+    """Rebuild the area_ptr -> (window, area) index from the current layout."""
+    _AREA_LOOKUP.clear()
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                _AREA_LOOKUP[area.as_pointer()] = (window, area)
+
+
 def check_and_restore_perspective():
     """Check if user has rotated away from aligned view and restore original perspective if so"""
-    if GL_TOKEN_LOCK.is_set() or not GL_VIEWPORT_STATE:
+    if _rotating_space_ptrs or not GL_VIEWPORT_STATE:
         return
 
     try:
@@ -201,50 +305,99 @@ def check_and_restore_perspective():
     except Exception:
         prefs = None
 
-    live_ptrs = set()
-    for window in bpy.context.window_manager.windows:
-        for area in window.screen.areas:
-            if area.type != 'VIEW_3D':
+    # Snapshot the live layout before dereferencing anything; see the note
+    # on _AREA_LOOKUP for why the index cannot be cached between checks
+    _rebuild_area_lookup()
+
+    for area_ptr, state in list(GL_VIEWPORT_STATE.items()):
+        entry = _AREA_LOOKUP.get(area_ptr)
+        if entry is None:
+            # Viewport closed while still aligned: drop its state, but run
+            # the same settings restore/teardown as a normal leave so the
+            # global preferences are not left in the addon-forced state
+            del GL_VIEWPORT_STATE[area_ptr]
+            try:
+                windows = bpy.context.window_manager.windows
+                if windows:
+                    _restore_aligned_state_settings(windows[0], state)
+            except Exception:
+                pass
+            _restore_auto_perspective_if_last(bpy.context)
+            continue
+        window, area = entry
+        space = area.spaces[0]
+        rv3d = space.region_3d
+        current_rotation = rv3d.view_rotation
+        # Early-out: if neither the rotation nor the perspective changed
+        # since the last check, the dot-product work below is pointless
+        seen = (current_rotation.w, current_rotation.x, current_rotation.y,
+                current_rotation.z, rv3d.view_perspective)
+        if seen == state.last_seen:
+            continue
+        aligned_rotation = state.aligned_rotation
+
+        if prefs and prefs.pref_force_ortho_in_aligned_view:
+            if rv3d.view_perspective != 'ORTHO':
+                dot_product = current_rotation.dot(aligned_rotation)
+                # View rotation still matches aligned → user toggled perspective (e.g. numpad 5)
+                if dot_product * dot_product >= _ROTATION_DOT_THRESHOLD_SQ:
+                    rv3d.view_perspective = state.original_perspective
+                    del GL_VIEWPORT_STATE[area_ptr]
+                    _restore_aligned_state_settings(window, state)
+                    _restore_auto_perspective_if_last(bpy.context)
+                    continue
+                # Orbiting / auto-perspective switched view; force ortho back
+                rv3d.view_perspective = 'ORTHO'
+        else:
+            dot_product = current_rotation.dot(aligned_rotation)
+            if dot_product * dot_product < _ROTATION_DOT_THRESHOLD_SQ:
+                rv3d.view_perspective = state.original_perspective
+                del GL_VIEWPORT_STATE[area_ptr]
+                _restore_aligned_state_settings(window, state)
+                _restore_auto_perspective_if_last(bpy.context)
                 continue
-            area_ptr = get_area_pointer(area)
-            if area_ptr:
-                live_ptrs.add(area_ptr)
-            if area_ptr and area_ptr in GL_VIEWPORT_STATE:
-                state = GL_VIEWPORT_STATE[area_ptr]
-                if state['is_aligned']:
-                    space = area.spaces[0]
-                    current_rotation = space.region_3d.view_rotation
-                    aligned_rotation = state['aligned_rotation']
-
-                    if prefs and prefs.pref_force_ortho_in_aligned_view:
-                        if space.region_3d.view_perspective != 'ORTHO':
-                            dot_product = abs(current_rotation.dot(aligned_rotation))
-                            # View rotation still matches aligned → user toggled perspective (e.g. numpad 5)
-                            if dot_product >= A2C_ROTATION_DOT_THRESHOLD:
-                                space.region_3d.view_perspective = state['original_perspective']
-                                state['is_aligned'] = False
-                                _restore_aligned_state_settings(window, state)
-                                _restore_auto_perspective_if_last(bpy.context)
-                            else:
-                                # Orbiting / auto-perspective switched view; force ortho back
-                                space.region_3d.view_perspective = 'ORTHO'
-                    else:
-                        dot_product = abs(current_rotation.dot(aligned_rotation))
-                        if dot_product < A2C_ROTATION_DOT_THRESHOLD:
-                            space.region_3d.view_perspective = state['original_perspective']
-                            state['is_aligned'] = False
-                            _restore_aligned_state_settings(window, state)
-                            _restore_auto_perspective_if_last(bpy.context)
-
-    # Prune entries for viewports that no longer exist and are no longer aligned
-    stale = [p for p, s in GL_VIEWPORT_STATE.items()
-             if p not in live_ptrs and not s.get('is_aligned')]
-    for p in stale:
-        del GL_VIEWPORT_STATE[p]
-
-
-def viewport_draw_handler():
-    """Draw handler to monitor viewport rotation changes"""
+        # Entry survived the check; remember what we examined so the next
+        # notification for an unchanged view is a tuple compare only
+        state.last_seen = seen
+
+
+def _deferred_check():
+    """
+    Trailing-edge check scheduled when a notification lands inside the
+    throttle window, so the final view change of a gesture is never lost.
+    """
+    global _monitor_last_check
+    _monitor_last_check = time.monotonic()
+    try:
+        check_and_restore_perspective()
+    except Exception:
+        pass
+    return None
+
+
+def _on_viewport_view_change():
+    """
+    msgbus notification callback fired when a monitored RegionView3D's
+    view_rotation or view_perspective changes. Unlike the old POST_PIXEL
+    draw handler, this only runs when the view actually changes.
+    """
+    global _monitor_last_check
+    # Fast-path exit: nothing to monitor
+    if not GL_VIEWPORT_STATE:
+        return
+    now = time.monotonic()
+    remaining = _MONITOR_MIN_INTERVAL - (now - _monitor_last_check)
+    if remaining > 0.0:
+        # The source is edge-triggered: dropping the event outright could
+        # leave the last change of a gesture unchecked. Defer it instead.
+        try:
+            if not bpy.app.timers.is_registered(_deferred_check):
+                bpy.app.timers.register(_deferred_check,
+                                        first_interval=remaining)
+        except Exception:
+            pass
+        return
+    _monitor_last_check = now
     try:
         check_and_restore_perspective()
     except Exception:
@@ -252,6 +405,137 @@ def viewport_draw_handler():
         pass
 
 
+def _monitor_poll():
+    """
+    Low-frequency safety-net poll active while viewports are aligned, covering
+    view changes that never reach msgbus (see _MONITOR_POLL_INTERVAL).
+    Unschedules itself once nothing is tracked.
+    """
+    if not GL_VIEWPORT_STATE:
+        return None
+    try:
+        check_and_restore_perspective()
+    except Exception:
+        pass
+    return _MONITOR_POLL_INTERVAL
+
+
+def _subscribe_viewport_regions():
+    """
+    Subscribe to view_rotation/view_perspective changes on every 3D viewport
+    region not yet subscribed to. Safe to call repeatedly; already-subscribed
+    regions are skipped via their pointer, and pointers whose region has gone
+    away are forgotten so a new region reusing a freed pointer still gets
+    subscribed.
+    """
+    try:
+        windows = bpy.context.window_manager.windows
+    except Exception:
+        return
+    live_rv3d_ptrs = set()
+    for window in windows:
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            for space in area.spaces:
+                if space.type != 'VIEW_3D' or not space.region_3d:
+                    continue
+                rv3d = space.region_3d
+                rv3d_ptr = rv3d.as_pointer()
+                live_rv3d_ptrs.add(rv3d_ptr)
+                if rv3d_ptr in _subscribed_rv3d_ptrs:
+                    continue
+                for prop in ("view_rotation", "view_perspective"):
+                    bpy.msgbus.subscribe_rna(
+                        key=rv3d.path_resolve(prop, False),
+                        owner=_MSGBUS_OWNER,
+                        args=(),
+                        notify=_on_viewport_view_change,
+                    )
+                _subscribed_rv3d_ptrs.add(rv3d_ptr)
+    _subscribed_rv3d_ptrs.intersection_update(live_rv3d_ptrs)
+
+
+@bpy.app.handlers.persistent
+def _a2c_depsgraph_update_post(scene, depsgraph):
+    """Pick up 3D viewport regions created after register() (new areas/windows)."""
+    try:
+        _subscribe_viewport_regions()
+    except Exception:
+        pass
+
+
+@bpy.app.handlers.persistent
+def _a2c_load_post(filepath):
+    """
+    Re-subscribe after a file load: msgbus subscriptions are cleared and
+    region pointers change when a new file is opened.
+    """
+    _subscribed_rv3d_ptrs.clear()
+    _AREA_LOOKUP.clear()
+    try:
+        _subscribe_viewport_regions()
+    except Exception:
+        pass
+
+
+# True while the msgbus subscriptions and app handlers above are installed.
+# The monitor only exists while at least one viewport is in aligned view.
+_monitor_installed = False
+
+
+def _install_monitor():
+    """
+    Install the viewport monitoring subscriptions and handlers. Called when
+    the first viewport enters aligned view rather than at register(), so the
+    addon adds no per-view-change overhead while it is not tracking anything.
+    """
+    global _monitor_installed
+    if _monitor_installed:
+        return
+    _monitor_installed = True
+    _subscribe_viewport_regions()
+    bpy.app.handlers.depsgraph_update_post.append(_a2c_depsgraph_update_post)
+    bpy.app.handlers.load_post.append(_a2c_load_post)
+    if not bpy.app.timers.is_registered(_monitor_poll):
+        bpy.app.timers.register(_monitor_poll,
+                                first_interval=_MONITOR_POLL_INTERVAL)
+
+
+def _remove_monitor():
+    """Tear down the viewport monitoring subscriptions and handlers."""
+    global _monitor_installed
+    if not _monitor_installed:
+        return
+    _monitor_installed = False
+    bpy.msgbus.clear_by_owner(_MSGBUS_OWNER)
+    _subscribed_rv3d_ptrs.clear()
+    _AREA_LOOKUP.clear()
+    try:
+        if bpy.app.timers.is_registered(_deferred_check):
+            bpy.app.timers.unregister(_deferred_check)
+        if bpy.app.timers.is_registered(_monitor_poll):
+            bpy.app.timers.unregister(_monitor_poll)
+    except Exception:
+        pass
+    if _a2c_depsgraph_update_post in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_a2c_depsgraph_update_post)
+    if _a2c_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_a2c_load_post)
+
+
+def _deferred_monitor_teardown():
+    """
+    One-shot timer callback tearing down the monitor outside msgbus dispatch;
+    clear_by_owner() must not run from within its own notify callback. The
+    re-check keeps the monitor if a new alignment landed before the timer
+    fired.
+    """
+    if not GL_VIEWPORT_STATE:
+        _remove_monitor()
+    return None
+
+
 def _overlay_draw_callback():
     """Draw a persistent 'Aligned View' text label whenever the active viewport is in aligned state."""
     try:
@@ -314,7 +598,7 @@ def is_viewport_aligned(context):
     if not area_ptr:
         return False
     if area_ptr in GL_VIEWPORT_STATE:
-        return GL_VIEWPORT_STATE[area_ptr].get('is_aligned', False)
+        return True
     # Area not in state (e.g. recreated after maximize) – check if current
     # view rotation matches any stored aligned view and migrate state
     try:
@@ -323,10 +607,8 @@ def is_viewport_aligned(context):
             return False
         current_rotation = space.region_3d.view_rotation
         for ptr, state in list(GL_VIEWPORT_STATE.items()):
-            if not state.get('is_aligned'):
-                continue
-            if abs(current_rotation.dot(state['aligned_rotation'])) >= A2C_ROTATION_DOT_THRESHOLD:
-                GL_VIEWPORT_STATE[area_ptr] = dict(state)
+            if abs(current_rotation.dot(state.aligned_rotation)) >= A2C_ROTATION_DOT_THRESHOLD:
+                GL_VIEWPORT_STATE[area_ptr] = state.copy()
                 del GL_VIEWPORT_STATE[ptr]
                 return True
     except Exception:
@@ -346,14 +628,12 @@ def is_viewport_drifted(context):
     if not area_ptr or area_ptr not in GL_VIEWPORT_STATE:
         return False
     state = GL_VIEWPORT_STATE[area_ptr]
-    if not state.get('is_aligned'):
-        return False
     try:
         space = context.space_data
         if not space:
             return False
         current = space.region_3d.view_rotation
-        aligned = state['aligned_rotation']
+        aligned = state.aligned_rotation
         return abs(current.dot(aligned)) < A2C_ROTATION_DOT_THRESHOLD
     except Exception:
         return False
@@ -366,7 +646,7 @@ def find_nearest_canonical_quat(current_quat, state):
     the base orientation stored when entering aligned view.
     Returns None if base_matrix is not stored in state.
     """
-    base_matrix = state.get('base_matrix')
+    base_matrix = state.base_matrix
     if base_matrix is None:
         return None
     best_quat = None
@@ -401,25 +681,23 @@ def get_viewpoint_matrix_for_nearest(base_matrix, current_view_direction):
     Return the viewpoint rotation matrix (TOP, FRONT, etc.) that best matches
     the given view direction when combined with base_matrix. Used for NEAREST.
     """
-    max_dot = -float('inf')
-    best_viewpoint = "TOP"
-    for viewpoint_name, viewpoint_rot in A2C_VIEWPOINT_MATRICES.items():
-        target_view_direction = -(base_matrix @ viewpoint_rot).col[2]
-        dot = current_view_direction.dot(target_view_direction)
-        if dot > max_dot:
-            max_dot = dot
-            best_viewpoint = viewpoint_name
-    return A2C_VIEWPOINT_MATRICES[best_viewpoint]
+    base = np.array(base_matrix)
+    # Row i is the world-space view direction of viewpoint i: -(base @ M_i).col[2]
+    target_view_directions = _VIEWPOINT_NEG_Z @ base.T
+    dots = target_view_directions @ np.array(current_view_direction)
+    return A2C_VIEWPOINT_MATRICES[_VIEWPOINT_NAMES[int(np.argmax(dots))]]
 
 
 # ## Math functions section ###################################################
 def s_curve(x):
     """
-    Map a linear value in [0, 1] through an S-curve (sinusoidal ease in/out).
+    Map a linear value in [0, 1] through an S-curve (Hermite smoothstep
+    ease in/out). Visually indistinguishable from the previous sinusoidal
+    curve but avoids the transcendental call per rotation tick.
     Input is clamped to [0, 1] to stay numerically safe even with float drift.
     """
     x = max(0.0, min(1.0, x))
-    return (1.0 + math.sin((x - 0.5) * math.pi)) / 2.0
+    return x * x * (3.0 - 2.0 * x)
 
 
 def find_best_roll_orientation(current_quat, target_base_matrix, viewpoint_matrix):
@@ -449,81 +727,105 @@ def find_best_roll_orientation(current_quat, target_base_matrix, viewpoint_matri
     
     # Step 2: Do the standard cursor alignment
     aligned_matrix = target_base_matrix @ viewpoint_matrix
-    
-    # Step 3: Test 90-degree rotations to find the one that best preserves visual "up"
-    best_idx = 0
-    best_score = -1
-
-    for idx, roll_mat in enumerate(A2C_ROLL_MATRICES):
-        test_matrix = aligned_matrix @ roll_mat
 
-        # Get the new "up" direction after this rotation
-        new_up_direction = test_matrix.col[1]  # Y-axis column of the rotated matrix
+    # Step 3: Solve for the roll angle in closed form.
+    # After rolling by theta around the view Z axis, the new "up" direction is
+    # cos(theta) * aligned.col[1] - sin(theta) * aligned.col[0], so the dot
+    # product with visual_up is maximized at theta = atan2(-cx, cy). Rounding
+    # to the nearest multiple of 90° gives the best of the four roll options
+    # directly, without building and testing four candidate matrices.
+    cx = visual_up_direction.dot(aligned_matrix.col[0])
+    cy = visual_up_direction.dot(aligned_matrix.col[1])
+    best_idx = round(math.atan2(-cx, cy) / (math.pi / 2.0)) % 4
 
-        # Score based on how closely the new "up" matches the original visual "up"
-        # Use dot product - closer to 1.0 means better alignment
-        alignment_score = visual_up_direction.dot(new_up_direction)
-
-        # We want the highest dot product (closest to 1.0)
-        if alignment_score > best_score:
-            best_score = alignment_score
-            best_idx = idx
-
-    # Step 4: Apply the best rotation
-    final_rotation_matrix = A2C_ROLL_MATRICES[best_idx]
-    final_matrix = aligned_matrix @ final_rotation_matrix
-    
-    return final_matrix
+    # Step 4: Apply the best rotation. A 0° roll would multiply by the
+    # identity, so return the aligned matrix as-is in that case.
+    if best_idx == 0:
+        return aligned_matrix
+    return aligned_matrix @ A2C_ROLL_MATRICES[best_idx]
 
 
 # ## Smooth rotation ##########################################################
 
-_SMOOTH_ROT_STEP = 0.02
 _SMOOTH_ROT_DURATION = 0.24
 
 
-def smooth_rotate(space, quat_begin, quat_end, on_complete=None):
+def smooth_rotate(space, quat_begin, quat_end, on_complete=None, area=None):
     """
-    Rotate the 3D view smoothly between 'quat_begin' and 'quat_end' on a
-    background thread. Calls on_complete(space) when done, if provided.
-    Clears GL_TOKEN_LOCK when finished.
-    Exits early if _A2C_STOP_EVENT is set (e.g. during addon unregister / Blender shutdown).
+    Rotate the 3D view smoothly between 'quat_begin' and 'quat_end' using a
+    bpy.app.timers callback, so all view_rotation writes happen on the main
+    thread in step with the redraw loop (Blender's RNA is not thread-safe).
+    The callback reschedules itself with a zero delay and tags 'area' for
+    redraw, so Blender coalesces ticks to the display's refresh rate instead
+    of a hard-coded step — no wasted writes on slow displays, no choppiness
+    on fast ones. Calls on_complete(space) when done, if provided. The space
+    is marked busy in _rotating_space_ptrs for the duration of the rotation.
     """
-    if space:
-        diff_quat = quat_end.rotation_difference(quat_begin)
-        _, angle = diff_quat.to_axis_angle()
-        duration = abs(_SMOOTH_ROT_DURATION * angle / math.pi)
-
-        start_time = time.time()
-        current_time = start_time
+    if not space:
+        return
 
-        while current_time <= start_time + duration and not _A2C_STOP_EVENT.is_set():
-            if duration == 0.0:
-                factor = 1.0
-            else:
-                factor = s_curve((current_time - start_time) / duration)
-            space.region_3d.view_rotation = quat_begin.slerp(quat_end, factor)
-            time.sleep(_SMOOTH_ROT_STEP)
-            current_time = time.time()
+    # Compute the rotation axis and total angle once; each tick then only
+    # needs one quaternion construction and one multiply instead of a slerp
+    # with its internal trigonometry. rotation_difference returns
+    # quat_begin^-1 @ quat_end, so quat_begin @ diff^t traces the same path.
+    diff_quat = quat_begin.rotation_difference(quat_end)
+    if diff_quat.w < 0.0:
+        # Take the shorter arc, matching slerp's behaviour
+        diff_quat.negate()
+    axis, total_angle = diff_quat.to_axis_angle()
+    duration = abs(_SMOOTH_ROT_DURATION * total_angle / math.pi)
+
+    space_ptr = space.as_pointer()
+    _rotating_space_ptrs.add(space_ptr)
+    # perf_counter is monotonic and high resolution — unlike time.time it is
+    # immune to wall-clock adjustments mid-rotation. The deadline is computed
+    # once so each tick does a single clock read and compare.
+    start_time = time.perf_counter()
+    deadline = start_time + duration
+
+    def _tick():
+        try:
+            current_time = time.perf_counter()
+            if duration == 0.0 or current_time >= deadline:
+                space.region_3d.view_rotation = quat_end
+                space.region_3d.view_perspective = 'ORTHO'
+                if on_complete:
+                    on_complete(space)
+                _finish()
+                return None
+            factor = s_curve((current_time - start_time) / duration)
+            space.region_3d.view_rotation = (
+                quat_begin @ mu.Quaternion(axis, total_angle * factor)
+            )
+            if area is not None:
+                area.tag_redraw()
+            # Zero delay: run again as soon as possible; Blender coalesces
+            # this to the viewport redraw cadence
+            return 0.0
+        except Exception:
+            # The space may have been closed mid-rotation; stop quietly
+            _finish()
+            return None
 
-        if not _A2C_STOP_EVENT.is_set():
-            space.region_3d.view_rotation = quat_end
-            space.region_3d.view_perspective = 'ORTHO'
-            if on_complete:
-                on_complete(space)
+    def _finish():
+        _rotating_space_ptrs.discard(space_ptr)
+        if _tick in _active_rotation_timers:
+            _active_rotation_timers.remove(_tick)
 
-    GL_TOKEN_LOCK.clear()
+    _active_rotation_timers.append(_tick)
+    bpy.app.timers.register(_tick)
 
 
-def _start_rotation_thread(target, args=()):
-    """
-    Start a smooth-rotation background thread as a daemon.
-    Daemon threads are abandoned (not waited for) during Python shutdown,
-    preventing the crash that occurs when Blender closes mid-rotation.
-    """
-    t = thd.Thread(target=target, args=args, daemon=True)
-    t.start()
-    return t
+def _stop_all_rotations():
+    """Unregister any pending smooth-rotation timers (addon unload)."""
+    for tick in list(_active_rotation_timers):
+        try:
+            if bpy.app.timers.is_registered(tick):
+                bpy.app.timers.unregister(tick)
+        except Exception:
+            pass
+    _active_rotation_timers.clear()
+    _rotating_space_ptrs.clear()
 
 
 # ## Preferences section ######################################################
@@ -562,40 +864,34 @@ class VIEW3D_OT_a2c_pivot_view(bpy.types.Operator):
         rv3d = space.region_3d
         area_ptr = get_area_pointer(context.area)
         if self.from_canonical and area_ptr and area_ptr in GL_VIEWPORT_STATE:
-            state = GL_VIEWPORT_STATE[area_ptr]
-            if state.get('is_aligned') and 'aligned_rotation' in state:
-                view_quat = state['aligned_rotation'].copy()
-            else:
-                view_quat = rv3d.view_rotation.copy()
+            view_quat = GL_VIEWPORT_STATE[area_ptr].aligned_rotation.copy()
         else:
             view_quat = rv3d.view_rotation.copy()
         # Rotate in the view's local frame so roll is preserved:
         # local X = right, local Y = up, local Z = forward (view direction)
         if self.direction == 'LEFT':
             # Orbit left: rotate around local Y (up) by -90°
-            rot_quat = mu.Quaternion((0, 1, 0), math.radians(-90))
+            rot_quat = mu.Quaternion((0, 1, 0), -_RAD_90)
         elif self.direction == 'RIGHT':
-            rot_quat = mu.Quaternion((0, 1, 0), math.radians(90))
+            rot_quat = mu.Quaternion((0, 1, 0), _RAD_90)
         elif self.direction == 'TOP':
             # Tilt up: rotate around local X (right) by -90°
-            rot_quat = mu.Quaternion((1, 0, 0), math.radians(-90))
+            rot_quat = mu.Quaternion((1, 0, 0), -_RAD_90)
         else:  # BOTTOM
-            rot_quat = mu.Quaternion((1, 0, 0), math.radians(90))
+            rot_quat = mu.Quaternion((1, 0, 0), _RAD_90)
         # view_quat @ rot_quat = apply view then rotate in its local frame
         new_quat = (view_quat @ rot_quat).normalized()
 
-        prefs = context.preferences.addons[__package__].preferences
+        prefs = context.preferences.addons[_PKG].preferences
 
         if prefs.pref_smooth:
-            GL_TOKEN_LOCK.set()
-            _start_rotation_thread(smooth_rotate, (space, view_quat, new_quat))
+            smooth_rotate(space, view_quat, new_quat, area=context.area)
         else:
             rv3d.view_rotation = new_quat
 
         # Keep viewport in "aligned" state so relative pie layout stays available
         if area_ptr and area_ptr in GL_VIEWPORT_STATE:
-            GL_VIEWPORT_STATE[area_ptr]['aligned_rotation'] = new_quat
-            GL_VIEWPORT_STATE[area_ptr]['is_aligned'] = True
+            GL_VIEWPORT_STATE[area_ptr].aligned_rotation = new_quat
         return {'FINISHED'}
 
 
@@ -622,8 +918,6 @@ class VIEW3D_OT_a2c_snap_orbit(bpy.types.Operator):
         if not area_ptr or area_ptr not in GL_VIEWPORT_STATE:
             return {'CANCELLED'}
         state = GL_VIEWPORT_STATE[area_ptr]
-        if not state.get('is_aligned'):
-            return {'CANCELLED'}
         space = context.space_data
         if not space or space.type != 'VIEW_3D':
             return {'CANCELLED'}
@@ -636,17 +930,15 @@ class VIEW3D_OT_a2c_snap_orbit(bpy.types.Operator):
         if abs(current_quat.dot(target_quat)) >= A2C_ROTATION_DOT_THRESHOLD:
             return {'FINISHED'}
         try:
-            prefs = context.preferences.addons[__package__].preferences
+            prefs = context.preferences.addons[_PKG].preferences
         except Exception:
             return {'CANCELLED'}
         if prefs.pref_smooth:
-            GL_TOKEN_LOCK.set()
-            _start_rotation_thread(smooth_rotate, (space, current_quat, target_quat))
+            smooth_rotate(space, current_quat, target_quat, area=context.area)
         else:
             rv3d.view_rotation = target_quat
         rv3d.view_perspective = 'ORTHO'
-        state['aligned_rotation'] = target_quat
-        state['is_aligned'] = True
+        state.aligned_rotation = target_quat
         return {'FINISHED'}
 
 
@@ -704,12 +996,9 @@ Alt+Click the Exit/Leave button in the pie menu to trigger this"""
         area_ptr = get_area_pointer(context.area)
         if not area_ptr or area_ptr not in GL_VIEWPORT_STATE:
             return {'CANCELLED'}
-        state = GL_VIEWPORT_STATE[area_ptr]
-        if not state.get('is_aligned'):
-            return {'CANCELLED'}
+        state = GL_VIEWPORT_STATE.pop(area_ptr)
         # Restore transform orientation and object align without touching the camera transform
         _restore_aligned_state_settings(context.window, state)
-        state['is_aligned'] = False
         _restore_auto_perspective_if_last(context)
         self.report({'INFO'}, "Aligned View: Confirmed (camera angle kept)")
         return {'FINISHED'}
@@ -746,8 +1035,8 @@ Alt+Click the Smart button in the pie menu (non-aligned mode) to trigger this"""
                     del scene['a2c_object_align_before']
                 except Exception:
                     pass
-        for state in GL_VIEWPORT_STATE.values():
-            state['is_aligned'] = False
+        GL_VIEWPORT_STATE.clear()
+        _remove_monitor()
         _A2C_USE_AUTO_PERSPECTIVE_BEFORE_ANY = None
         self.report({'INFO'}, "Align2Custom: Auto Perspective, Transform Orientation and New Objects Align reset to defaults")
         return {'FINISHED'}
@@ -769,36 +1058,33 @@ class VIEW3D_OT_a2c_leave_aligned_view(bpy.types.Operator):
         if not area_ptr or area_ptr not in GL_VIEWPORT_STATE:
             return {'CANCELLED'}
         state = GL_VIEWPORT_STATE[area_ptr]
-        if not state.get('is_aligned'):
-            return {'CANCELLED'}
-        if 'view_rotation_before' not in state or 'view_location_before' not in state:
+        if state.view_rotation_before is None or state.view_location_before is None:
             return {'CANCELLED'}
         space = context.space_data
         rv3d = space.region_3d
         current_quat = rv3d.view_rotation.copy()
-        target_quat = state['view_rotation_before'].copy()
+        target_quat = state.view_rotation_before.copy()
 
         # Restore transform orientation and object align immediately (auto-perspective deferred)
         _restore_aligned_state_settings(context.window, state)
 
-        prefs = context.preferences.addons[__package__].preferences
+        prefs = context.preferences.addons[_PKG].preferences
         if prefs.pref_smooth:
-            GL_TOKEN_LOCK.set()
-
             def on_leave_complete(space):
-                space.region_3d.view_location = state['view_location_before'].copy()
-                space.region_3d.view_distance = state['view_distance_before']
-                space.region_3d.view_perspective = state['original_perspective']
-                state['is_aligned'] = False
+                space.region_3d.view_location = state.view_location_before.copy()
+                space.region_3d.view_distance = state.view_distance_before
+                space.region_3d.view_perspective = state.original_perspective
+                GL_VIEWPORT_STATE.pop(area_ptr, None)
                 _restore_auto_perspective_if_last(bpy.context)
 
-            _start_rotation_thread(smooth_rotate, (space, current_quat, target_quat, on_leave_complete))
+            smooth_rotate(space, current_quat, target_quat, on_leave_complete,
+                          area=context.area)
         else:
             rv3d.view_rotation = target_quat
-            rv3d.view_location = state['view_location_before'].copy()
-            rv3d.view_distance = state['view_distance_before']
-            rv3d.view_perspective = state['original_perspective']
-            state['is_aligned'] = False
+            rv3d.view_location = state.view_location_before.copy()
+            rv3d.view_distance = state.view_distance_before
+            rv3d.view_perspective = state.original_perspective
+            GL_VIEWPORT_STATE.pop(area_ptr, None)
             _restore_auto_perspective_if_last(context)
         self.report({'INFO'}, "Aligned View: Disabled")
         return {'FINISHED'}
@@ -832,28 +1118,22 @@ class VIEW3D_OT_a2c_roll_view(bpy.types.Operator):
         rv3d = space.region_3d
         area_ptr = get_area_pointer(context.area)
         if self.from_canonical and area_ptr and area_ptr in GL_VIEWPORT_STATE:
-            state = GL_VIEWPORT_STATE[area_ptr]
-            if state.get('is_aligned') and 'aligned_rotation' in state:
-                view_quat = state['aligned_rotation'].copy()
-            else:
-                view_quat = rv3d.view_rotation.copy()
+            view_quat = GL_VIEWPORT_STATE[area_ptr].aligned_rotation.copy()
         else:
             view_quat = rv3d.view_rotation.copy()
         # Roll: rotate around view's forward axis (local Z)
         new_quat = (view_quat @ mu.Quaternion((0, 0, 1), self.angle)).normalized()
 
-        prefs = context.preferences.addons[__package__].preferences
+        prefs = context.preferences.addons[_PKG].preferences
 
         if prefs.pref_smooth:
-            GL_TOKEN_LOCK.set()
-            _start_rotation_thread(smooth_rotate, (space, view_quat, new_quat))
+            smooth_rotate(space, view_quat, new_quat, area=context.area)
         else:
             rv3d.view_rotation = new_quat
 
         rv3d.view_perspective = 'ORTHO'
         if area_ptr and area_ptr in GL_VIEWPORT_STATE:
-            GL_VIEWPORT_STATE[area_ptr]['aligned_rotation'] = new_quat
-            GL_VIEWPORT_STATE[area_ptr]['is_aligned'] = True
+            GL_VIEWPORT_STATE[area_ptr].aligned_rotation = new_quat
         return {'FINISHED'}
 
 
@@ -883,7 +1163,7 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
         """Offer to switch to Edge Align when in Selection mode with one edge selected."""
         if should_offer_switch_to_edge(context, self.prop_align_mode):
             try:
-                prefs = context.preferences.addons[__package__].preferences
+                prefs = context.preferences.addons[_PKG].preferences
                 if getattr(prefs, "pref_offer_edge_mode_when_one_edge", True):
                     wm = context.window_manager
                     wm.a2c_pending_edge_viewpoint = self.prop_viewpoint
@@ -903,8 +1183,16 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
         preferences UI. The transition can be instantaneous or smooth.
         """
 
-        # Get the addon preferences
-        prefs = context.preferences.addons[__package__].preferences
+        # Get the addon preferences once and hoist the flags used below into
+        # locals — each prefs attribute read is a string-keyed RNA lookup
+        prefs = context.preferences.addons[_PKG].preferences
+        smooth = prefs.pref_smooth
+        minimize_roll = prefs.pref_minimize_roll
+        force_ortho = prefs.pref_force_ortho_in_aligned_view
+        use_view_orientation = prefs.pref_use_view_orientation_in_aligned_view
+        should_set_view_orientation = prefs.pref_set_orientation_to_view and (
+            self.prop_align_mode != 'CUSTOM' or prefs.pref_set_orientation_to_view_for_custom
+        )
 
         scene = context.window.scene
         space = context.space_data
@@ -930,7 +1218,7 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
                       (self.prop_align_mode == 'SELECTION' and temp_orientation_created) or \
                       (self.prop_align_mode == 'CUSTOM' and co)
         
-        if (not GL_TOKEN_LOCK.is_set()) and (space.type == 'VIEW_3D') and can_proceed:
+        if (space.as_pointer() not in _rotating_space_ptrs) and (space.type == 'VIEW_3D') and can_proceed:
 
             # Store original perspective and full view state before alignment (for "Leave aligned view")
             rv3d = space.region_3d
@@ -949,15 +1237,15 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
             # Compute the rotation matrix according to the desired viewpoint
             if self.prop_viewpoint == "NEAREST":
                 current_quat = space.region_3d.view_rotation
-                current_view_direction = -current_quat.to_matrix().col[2]
+                current_view_direction = current_quat @ _NEG_Z
                 rot_matrix = get_viewpoint_matrix_for_nearest(base_matrix, current_view_direction)
             elif self.prop_viewpoint in A2C_VIEWPOINT_MATRICES:
                 rot_matrix = A2C_VIEWPOINT_MATRICES[self.prop_viewpoint]
             else:   # TOP (DEFAULT)
-                rot_matrix = mu.Matrix.Identity(3)
+                rot_matrix = A2C_VIEWPOINT_MATRICES["TOP"]
 
             # Use minimize roll feature if enabled
-            if prefs.pref_minimize_roll:
+            if minimize_roll:
                 current_quat = space.region_3d.view_rotation
                 new_orientation = find_best_roll_orientation(current_quat, base_matrix, rot_matrix)
             else:
@@ -975,21 +1263,19 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
             # Store viewport state before making changes
             transform_orientation_before = None
             object_align_before = None
-            should_set_view_orientation = prefs.pref_set_orientation_to_view and (
-                self.prop_align_mode != 'CUSTOM' or prefs.pref_set_orientation_to_view_for_custom
-            )
             if should_set_view_orientation:
                 transform_orientation_before = scene.transform_orientation_slots[0].type
-            if prefs.pref_use_view_orientation_in_aligned_view:
+            if use_view_orientation:
                 try:
                     object_align_before = context.preferences.edit.object_align
                 except Exception:
                     pass
             use_auto_perspective_before = None
-            if prefs.pref_force_ortho_in_aligned_view:
-                # Must capture before store_viewport_state marks is_aligned=True,
-                # otherwise the "any already aligned?" guard in the capture function
-                # fires prematurely and the global value is never saved.
+            if force_ortho:
+                # Must capture before store_viewport_state adds this area's
+                # entry, otherwise the "any already aligned?" guard in the
+                # capture function fires prematurely and the global value is
+                # never saved.
                 _capture_auto_perspective_if_first(context)
                 try:
                     use_auto_perspective_before = context.preferences.inputs.use_auto_perspective
@@ -1007,7 +1293,7 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
             )
 
             space.region_3d.view_perspective = 'ORTHO'
-            if prefs.pref_force_ortho_in_aligned_view:
+            if force_ortho:
                 try:
                     context.preferences.inputs.use_auto_perspective = False
                 except Exception:
@@ -1016,10 +1302,9 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
             self.report({'INFO'}, "Aligned View: Enabled ({})".format(
                 self.prop_align_mode.capitalize()))
 
-            if prefs.pref_smooth:
+            if smooth:
                 initial_quat = space.region_3d.view_rotation
-                GL_TOKEN_LOCK.set()
-                _start_rotation_thread(smooth_rotate, (space, initial_quat, final_quat))
+                smooth_rotate(space, initial_quat, final_quat, area=context.area)
             else:
                 space.region_3d.view_rotation = final_quat
 
@@ -1027,7 +1312,7 @@ class VIEW3D_OT_a2c(bpy.types.Operator):
             if should_set_view_orientation:
                 scene.transform_orientation_slots[0].type = 'VIEW'
             # Set "New Objects > Align to" to View if preference is enabled (affects newly added primitives only)
-            if prefs.pref_use_view_orientation_in_aligned_view:
+            if use_view_orientation:
                 try:
                     scene['a2c_object_align_before'] = context.preferences.edit.object_align
                     context.preferences.edit.object_align = 'VIEW'
@@ -1122,12 +1407,12 @@ along the edge, aligns the view, then restores the cursor."""
             current_quat = rv3d.view_rotation
 
             if self.prop_viewpoint == "NEAREST":
-                current_view_direction = -(current_quat.to_matrix().col[2])
+                current_view_direction = current_quat @ _NEG_Z
                 rot_matrix = get_viewpoint_matrix_for_nearest(base_matrix, current_view_direction)
             elif self.prop_viewpoint in A2C_VIEWPOINT_MATRICES:
                 rot_matrix = A2C_VIEWPOINT_MATRICES[self.prop_viewpoint]
             else:
-                rot_matrix = mu.Matrix.Identity(3)
+                rot_matrix = A2C_VIEWPOINT_MATRICES["TOP"]
 
             if prefs.pref_minimize_roll:
                 pre_orientation = find_best_roll_orientation(current_quat, base_matrix, rot_matrix)
@@ -1205,16 +1490,16 @@ along the edge, aligns the view, then restores the cursor."""
                 area_ptr = get_area_pointer(context.area)
                 if area_ptr and area_ptr in GL_VIEWPORT_STATE:
                     state = GL_VIEWPORT_STATE[area_ptr]
-                    state["view_rotation_before"] = saved_view_for_leave["view_rotation_before"].copy()
-                    state["view_location_before"] = saved_view_for_leave["view_location_before"].copy()
-                    state["view_distance_before"] = saved_view_for_leave["view_distance_before"]
-                    state["original_perspective"] = saved_view_for_leave["original_perspective"]
+                    state.view_rotation_before = saved_view_for_leave["view_rotation_before"].copy()
+                    state.view_location_before = saved_view_for_leave["view_location_before"].copy()
+                    state.view_distance_before = saved_view_for_leave["view_distance_before"]
+                    state.original_perspective = saved_view_for_leave["original_perspective"]
                     if saved_view_for_leave.get("transform_orientation_before") is not None:
-                        state["transform_orientation_before"] = saved_view_for_leave["transform_orientation_before"]
+                        state.transform_orientation_before = saved_view_for_leave["transform_orientation_before"]
                     if saved_view_for_leave.get("object_align_before") is not None:
-                        state["object_align_before"] = saved_view_for_leave["object_align_before"]
+                        state.object_align_before = saved_view_for_leave["object_align_before"]
                     if saved_view_for_leave.get("use_auto_perspective_before") is not None:
-                        state["use_auto_perspective_before"] = saved_view_for_leave["use_auto_perspective_before"]
+                        state.use_auto_perspective_before = saved_view_for_leave["use_auto_perspective_before"]
 
         finally:
             # Restore cursor to its original state regardless of what happened
@@ -1236,10 +1521,7 @@ def register():
     """
     Module register function called by the main package register function
     """
-    global GL_DRAW_HANDLER, _A2C_OVERLAY_HANDLER
-
-    # Clear the stop flag in case the addon was just reloaded after being disabled
-    _A2C_STOP_EVENT.clear()
+    global _A2C_OVERLAY_HANDLER
 
     # Restore object_align if the addon changed it in a previous session
     # (e.g. Blender was closed while in aligned view and the runtime state was lost)
@@ -1255,10 +1537,8 @@ def register():
     bpy.utils.register_class(VIEW3D_OT_a2c)
     bpy.utils.register_class(VIEW3D_OT_a2c_align_to_edge)
 
-    # Register the viewport draw handler (rotation monitoring)
-    GL_DRAW_HANDLER = bpy.types.SpaceView3D.draw_handler_add(
-        viewport_draw_handler, (), 'WINDOW', 'POST_PIXEL'
-    )
+    # The viewport rotation monitor (msgbus subscriptions + handlers) is
+    # installed lazily by store_viewport_state when the first view is aligned
     # Register the aligned-view overlay text draw handler
     _A2C_OVERLAY_HANDLER = bpy.types.SpaceView3D.draw_handler_add(
         _overlay_draw_callback, (), 'WINDOW', 'POST_PIXEL'
@@ -1269,21 +1549,17 @@ def unregister():
     """
     Module unregister function called by the main package register function
     """
-    global GL_VIEWPORT_STATE, GL_DRAW_HANDLER, _A2C_OVERLAY_HANDLER
+    global GL_VIEWPORT_STATE, _A2C_OVERLAY_HANDLER
 
-    # Signal any running smooth-rotation thread to stop, then wait long enough
-    # for it to notice the flag (one sleep step + margin).  This prevents the
-    # EXCEPTION_ACCESS_VIOLATION crash that occurs when Blender closes while a
-    # daemon rotation thread is still writing to region_3d.view_rotation.
-    _A2C_STOP_EVENT.set()
-    time.sleep(_SMOOTH_ROT_STEP * 3)
-    GL_TOKEN_LOCK.clear()
+    # Cancel any smooth rotation still in flight so its timer does not fire
+    # after the addon's classes are gone
+    _stop_all_rotations()
 
     # Restore object_align if we changed it and the user is still in aligned view
     for state in GL_VIEWPORT_STATE.values():
-        if state.get('is_aligned') and 'object_align_before' in state:
+        if state.object_align_before is not None:
             try:
-                bpy.context.preferences.edit.object_align = state['object_align_before']
+                bpy.context.preferences.edit.object_align = state.object_align_before
             except Exception:
                 pass
             break
@@ -1292,10 +1568,8 @@ def unregister():
     # Clean up global state
     GL_VIEWPORT_STATE.clear()
 
-    # Remove the viewport draw handlers
-    if GL_DRAW_HANDLER:
-        bpy.types.SpaceView3D.draw_handler_remove(GL_DRAW_HANDLER, 'WINDOW')
-        GL_DRAW_HANDLER = None
+    # Remove the viewport monitoring subscriptions and handlers
+    _remove_monitor()
     if _A2C_OVERLAY_HANDLER:
         bpy.types.SpaceView3D.draw_handler_remove(_A2C_OVERLAY_HANDLER, 'WINDOW')
         _A2C_OVERLAY_HANDLER = None
@@ -37,6 +37,11 @@ from .ops import A2C_VIEWPOINT_ITEMS, A2C_PIE_MODE_ITEMS, is_viewport_drifted, s
 
 # ## Global data ###############################################################
 
+# Roll angles in radians, precomputed once — the pie menu draw callback runs
+# on every repaint while the menu is open.
+_RAD_90 = math.radians(90.0)
+_RAD_180 = math.radians(180.0)
+
 _pie_keymaps = []
 
 # Keymap info exposed for preferences to draw the keymap editor
@@ -251,17 +256,17 @@ class VIEW3D_MT_a2c_pie(bpy.types.Menu):
             op.from_canonical = is_drifted
             # 5
             op = pie.operator("view3d.a2c_roll_view", icon='LOOP_BACK', text="Roll -90°" + suffix)
-            op.angle = math.radians(-90)
+            op.angle = -_RAD_90
             op.from_canonical = is_drifted
             # 6
             op = pie.operator("view3d.a2c_roll_view", icon='LOOP_FORWARDS', text="Roll +90°" + suffix)
-            op.angle = math.radians(90)
+            op.angle = _RAD_90
             op.from_canonical = is_drifted
             # 7
             pie.operator("view3d.a2c_exit_pie", icon='SCREEN_BACK', text="Exit")
             # 8
             op = pie.operator("view3d.a2c_roll_view", icon='DECORATE_OVERRIDE', text="Roll +180°" + suffix)
-            op.angle = math.radians(180)
+            op.angle = _RAD_180
             op.from_canonical = is_drifted
 
         else:
@@ -324,6 +329,18 @@ class VIEW3D_MT_a2c(bpy.types.Menu):
     bl_idname = "VIEW3D_MT_a2c"
     bl_label = "Align View base class"
 
+    # (label, viewpoint, separator_before, icon or None) — built once; menu
+    # draw callbacks run on every panel repaint so the table is not rebuilt
+    _MENU_ENTRIES = (
+        ("Top",     'TOP',     False, None),
+        ("Bottom",  'BOTTOM',  False, None),
+        ("Front",   'FRONT',   True,  None),
+        ("Back",    'BACK',    False, None),
+        ("Right",   'RIGHT',   True,  None),
+        ("Left",    'LEFT',    False, None),
+        ("Smart",   'NEAREST', True,  'SHADERFX'),
+    )
+
     def draw(self, context):
         self.create_items(context)
 
@@ -331,17 +348,7 @@ class VIEW3D_MT_a2c(bpy.types.Menu):
         use_edge = (align_mode == 'EDGE')
         op_idname = "view3d.a2c_align_to_edge" if use_edge else "view3d.a2c"
 
-        # (label, viewpoint, separator_before, icon or None)
-        entries = (
-            ("Top",     'TOP',     False, None),
-            ("Bottom",  'BOTTOM',  False, None),
-            ("Front",   'FRONT',   True,  None),
-            ("Back",    'BACK',    False, None),
-            ("Right",   'RIGHT',   True,  None),
-            ("Left",    'LEFT',    False, None),
-            ("Smart",   'NEAREST', True,  'SHADERFX'),
-        )
-        for label, viewpoint, sep, icon in entries:
+        for label, viewpoint, sep, icon in self._MENU_ENTRIES:
             if sep:
                 self.layout.separator()
             op = self.layout.operator(op_idname, text=label, icon=icon if icon else 'NONE')